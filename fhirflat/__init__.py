@@ -3,22 +3,41 @@ fhirflat is a library for transforming FHIR resources in NDJSON or native Python
 dictionaries to a flat structure that can be written to a Parquet file.
 """
 
-from .resources import (
-    Condition,
-    Encounter,
-    Immunization,
-    Location,
-    MedicationAdministration,
-    MedicationStatement,
-    Observation,
-    Organization,
-    Patient,
-    Procedure,
-    ResearchSubject,
-    Specimen,
-)
+from typing import TYPE_CHECKING
+
+from . import resources
 from .ingest import convert_data_to_flat
 
+if TYPE_CHECKING:
+    from .resources import (
+        Condition,
+        Encounter,
+        Immunization,
+        Location,
+        MedicationAdministration,
+        MedicationStatement,
+        Observation,
+        Organization,
+        Patient,
+        Procedure,
+        ResearchSubject,
+        Specimen,
+    )
+
 # Update this when bumping version in pyproject.toml!
 __version__ = "0.1.0"
 __all__ = ["convert_data_to_flat"]
+
+
+def __getattr__(name: str):
+    """
+    Gives access to the resource classes at the top level, e.g.
+    ``from fhirflat import Patient``. They are loaded lazily by fhirflat.resources.
+    """
+    if name in resources.__all__:
+        return getattr(resources, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *resources.__all__})
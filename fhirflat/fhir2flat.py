@@ -135,7 +135,7 @@ def expandCoding(df: pd.DataFrame, column_name: str) -> pd.DataFrame:
         new_names = []
         for c in codes:
             if c.get("code") and c.get("system"):
-                new_codes.append(c.get("system") + "|" + c.get("code"))
+                new_codes.append(f"{c['system']}|{c['code']}")
             new_names.append(c.get("display"))
 
         # empty list if no alphanumeric code is present
@@ -1,4 +1,6 @@
 # Converts FHIRflat files into FHIR resources
+import functools
+
 from fhir.resources.backbonetype import BackboneType as _BackboneType
 from fhir.resources.codeableconcept import CodeableConcept
 from fhir.resources.datatype import DataType as _DataType
@@ -16,6 +18,33 @@ from .util import (
 )
 
 
+def split_code(code: str) -> tuple[str, str]:
+    """
+    Splits a FHIRflat "system|code" string into the system and the code.
+    """
+    system, sep, code_value = code.partition("|")
+    if not sep:
+        raise ValueError(f"Code {code} is not in the form 'system|code'")
+    return system, code_value
+
+
+def strip_group(data: dict) -> dict:
+    """
+    Removes the outermost group name from the keys of a dictionary of flattened data,
+    e.g. {"code.code": ..., "code.text": ...} becomes {"code": ..., "text": ...}
+    """
+    return {k.partition(".")[2]: v for k, v in data.items()}
+
+
+@functools.cache
+def schema_properties(klass: type[BaseModel]) -> dict:
+    """
+    Returns the schema properties of a FHIR class. The schema of the larger resources
+    is costly to look up, so it is fetched once per class.
+    """
+    return klass.schema()["properties"]
+
+
 def create_codeable_concept(
     old_dict: dict[str, list[str] | str | float | None], name: str
 ) -> dict[str, list[str]]:
@@ -55,25 +84,27 @@ def create_codeable_concept(
             )
         }
 
-    if len(codes) == 1:
-        system, code = codes[0].split("|")
+    if not codes:
+        # text only, no codes to split
         display = (
             old_dict[name + ".text"][0]
             if isinstance(old_dict[name + ".text"], list)
             else old_dict[name + ".text"]
         )
-        new_dict = {"coding": [{"system": system, "code": code, "display": display}]}
-    elif not codes:
+        return {"coding": [{"display": display}]}
+
+    if len(codes) == 1:
+        system, code = split_code(codes[0])
         display = (
             old_dict[name + ".text"][0]
             if isinstance(old_dict[name + ".text"], list)
             else old_dict[name + ".text"]
         )
-        new_dict = {"coding": [{"display": display}]}
+        new_dict = {"coding": [{"system": system, "code": code, "display": display}]}
     else:
         new_dict = {"coding": []}
         for cd, nme in zip(codes, old_dict[name + ".text"], strict=True):
-            system, code = cd.split("|")
+            system, code = split_code(cd)
             display = nme
 
             subdict = {"system": system, "code": code, "display": display}
@@ -87,14 +118,14 @@ def createQuantity(df, group):
     quant = {}
 
     for attribute in df.keys():
-        attr = attribute.split(".")[-1]
+        attr = attribute.rpartition(".")[2]
         if attr == "code":
             if group + ".system" in df.keys():
                 # reading in from ingestion pipeline
                 quant["code"] = df[group + ".code"]
                 quant["system"] = df[group + ".system"]
             else:
-                system, code = df[group + ".code"].split("|")
+                system, code = split_code(df[group + ".code"])
                 quant["code"] = code
                 quant["system"] = system
         else:
@@ -121,7 +152,7 @@ def createExtension(exts: dict):
     extension_classes = {e: get_local_extension_type(e) for e in exts.keys()}
 
     for e, v in exts.items():
-        properties = extension_classes[e].schema()["properties"]
+        properties = schema_properties(extension_classes[e])
         data_options = [key for key in properties.keys() if key.startswith("value")]
         if len(data_options) == 1:
             extensions.append({"url": e, data_options[0]: v})
@@ -146,21 +177,17 @@ def set_datatypes(k, v_dict, klass) -> dict:
         return {"start": v_dict.get(k + ".start"), "end": v_dict.get(k + ".end")}
     elif issubclass(klass, FHIRPrimitiveExtension):
         return {
-            "extension": createExtension(
-                {s.split(".", 1)[1]: v_dict[s] for s in v_dict}
-            ),
+            "extension": createExtension(strip_group(v_dict)),
         }
     elif issubclass(klass, _DataType) and not issubclass(klass, _BackboneType):
         # not quite
-        prop = klass.schema()["properties"]
+        prop = schema_properties(klass)
         value_type = [key for key in prop.keys() if key.startswith("value")]
         if not value_type:
             # nested extension
             return {
                 "url": k,
-                "extension": createExtension(
-                    {s.split(".", 1)[1]: v_dict[s] for s in v_dict}
-                ),
+                "extension": createExtension(strip_group(v_dict)),
             }
 
         data_type = prop[value_type[0]]["type"]
@@ -171,7 +198,7 @@ def set_datatypes(k, v_dict, klass) -> dict:
             # datatype should be a primitive
             return {"url": k, f"{value_type[0]}": v_dict[k]}
 
-    return {s.split(".", 1)[1]: v_dict[s] for s in v_dict}
+    return strip_group(v_dict)
 
 
 def find_data_class(data_class: list[BaseModel] | BaseModel, k: str) -> BaseModel:
@@ -196,7 +223,7 @@ def find_data_class(data_class: list[BaseModel] | BaseModel, k: str) -> BaseMode
             raise ValueError(f"Couldn't find a matching class for {k} in {data_class}")
 
     else:
-        k_schema = data_class.schema()["properties"].get(k)
+        k_schema = schema_properties(data_class).get(k)
 
         base_class = (
             k_schema.get("items").get("type")
@@ -229,7 +256,7 @@ def expand_concepts(data: dict[str, str], data_class: type[_DomainResource]) ->
         v_dict = {k: data[k] for k in v}
         if any(s.count(".") > 1 for s in v):
             # strip the outside group name
-            stripped_dict = {s.split(".", 1)[1]: v_dict[s] for s in v}
+            stripped_dict = strip_group(v_dict)
             # call recursively
             new_v_dict = expand_concepts(stripped_dict, data_class=group_classes[k])
             # add outside group key back on
@@ -237,7 +264,7 @@ def expand_concepts(data: dict[str, str], data_class: type[_DomainResource]) ->
 
         if all(isinstance(v, dict) for v in v_dict.values()):
             # coming back out of nested recursion
-            expanded[k] = {s.split(".", 1)[1]: v_dict[s] for s in v_dict}
+            expanded[k] = strip_group(v_dict)
 
         elif any(isinstance(v, dict) for v in v_dict.values()) and isinstance(
             group_classes[k], list
@@ -246,21 +273,19 @@ def expand_concepts(data: dict[str, str], data_class: type[_DomainResource]) ->
             non_dict_items = {
                 k: v for k, v in v_dict.items() if not isinstance(v, dict)
             }
-            stripped_dict = {
-                s.split(".", 1)[1]: non_dict_items[s] for s in non_dict_items.keys()
-            }
+            stripped_dict = strip_group(non_dict_items)
             for k1, v1 in stripped_dict.items():
                 klass = find_data_class(group_classes[k], k1)
                 v_dict[k + "." + k1] = set_datatypes(k1, {k1: v1}, klass)
 
-            expanded[k] = {s.split(".", 1)[1]: v_dict[s] for s in v_dict}
+            expanded[k] = strip_group(v_dict)
 
         else:
             expanded[k] = set_datatypes(k, v_dict, group_classes[k])
 
         if isinstance(data_class, list):
             continue
-        elif data_class.schema()["properties"][k].get("type") == "array":
+        elif schema_properties(data_class)[k].get("type") == "array":
             if k == "extension":
                 expanded[k] = list(expanded[k].values())
             else:
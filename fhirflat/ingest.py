@@ -9,6 +9,7 @@ import os
 import shutil
 import timeit
 import warnings
+from collections.abc import Mapping
 from datetime import datetime
 from glob import glob
 from math import isnan
@@ -130,17 +131,27 @@ def format_dates(date_str: str, date_format: str, timezone: str) -> str:
 
 
 def create_dict_wide(
-    row: pd.Series, map_df: pd.DataFrame, date_format: str, timezone: str
+    row: Mapping,
+    map_df: pd.DataFrame,
+    date_format: str,
+    timezone: str,
+    mapped_columns: set | None = None,
 ) -> dict:
     """
     Takes a wide-format dataframe and iterates through the columns of the row,
     applying the mapping to each column and produces a fhirflat-like dictionary to
     initialize the resource object for each row.
+
+    The row can be a pandas Series or a plain dictionary of column: value.
+    mapped_columns is the set of raw variables in map_df; pass it in when mapping
+    many rows so it is only built once.
     """
 
     result: dict = {}
-    for column in row.index:
-        if column in map_df.index.get_level_values(0):
+    if mapped_columns is None:
+        mapped_columns = set(map_df.index.get_level_values(0))
+    for column in row.keys():
+        if column in mapped_columns:
             response = row[column]
             if pd.notna(response):  # Ensure there is a response to map
                 try:
@@ -269,7 +280,7 @@ def create_dict_long(
 
 
 def create_dictionary(
-    data_file: str,
+    data_file: str | pd.DataFrame,
     map_file: str,
     resource: str,
     one_to_one=False,
@@ -284,8 +295,9 @@ def create_dictionary(
 
     Parameters
     ----------
-    data: str
-        The path to the data file containing the clinical data.
+    data_file: str | pd.DataFrame
+        The path to the data file containing the clinical data, or the data itself if
+        it has already been read in. The dataframe is not modified.
     map_file: pd.DataFrame
         The path to the mapping file containing the mapping of the clinical data to the
         FHIR resource.
@@ -301,7 +313,11 @@ def create_dictionary(
         The timezone of the dates in the data file. E.g. "Europe/London"
     """
 
-    data: pd.DataFrame = pd.read_csv(data_file, header=0)
+    data: pd.DataFrame = (
+        data_file
+        if isinstance(data_file, pd.DataFrame)
+        else pd.read_csv(data_file, header=0)
+    )
     map_df: pd.DataFrame = pd.read_csv(map_file, header=0)
 
     # setup the data -----------------------------------------------------------
@@ -364,9 +380,12 @@ def create_dictionary(
 
     # Generate the flat_like dictionary
     if one_to_one:
-        filtered_data["flat_dict"] = filtered_data.apply(
-            create_dict_wide, args=[map_df, date_format, timezone], axis=1
-        )
+        mapped_columns = set(map_df.index.get_level_values(0))
+        # plain dicts are much cheaper to index than a Series per row
+        filtered_data["flat_dict"] = [
+            create_dict_wide(row, map_df, date_format, timezone, mapped_columns)
+            for row in filtered_data.to_dict(orient="records")
+        ]
         return filtered_data
     else:
         melted_data["flat_dict"] = melted_data.apply(
@@ -490,12 +509,15 @@ def convert_data_to_flat(
             for r, i in sheet_keys.items()
         }
 
+    # parse the raw data once and share it between resources, it is only read from
+    raw_data = pd.read_csv(data, header=0)
+
     for resource, map_file in mappings.items():
         start_time = timeit.default_timer()
         t = types[resource.__name__]
         if t == "one-to-one":
             df = create_dictionary(
-                data,
+                raw_data,
                 map_file,
                 resource.__name__,
                 one_to_one=True,
@@ -507,7 +529,7 @@ def convert_data_to_flat(
                 continue
         elif t == "one-to-many":
             df = create_dictionary(
-                data,
+                raw_data,
                 map_file,
                 resource.__name__,
                 one_to_one=False,
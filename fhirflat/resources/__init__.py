@@ -10,18 +10,24 @@ specific FHIR extensions.
 .. _fhir.resources: https://pypi.org/project/fhir.resources
 """
 
-from .condition import Condition
-from .encounter import Encounter
-from .immunization import Immunization
-from .location import Location
-from .medicationadministration import MedicationAdministration
-from .medicationstatement import MedicationStatement
-from .observation import Observation
-from .organization import Organization
-from .patient import Patient
-from .procedure import Procedure
-from .researchsubject import ResearchSubject
-from .specimen import Specimen
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .condition import Condition
+    from .encounter import Encounter
+    from .immunization import Immunization
+    from .location import Location
+    from .medicationadministration import MedicationAdministration
+    from .medicationstatement import MedicationStatement
+    from .observation import Observation
+    from .organization import Organization
+    from .patient import Patient
+    from .procedure import Procedure
+    from .researchsubject import ResearchSubject
+    from .specimen import Specimen
 
 __all__ = [
     "Condition",
@@ -37,3 +43,20 @@ __all__ = [
     "ResearchSubject",
     "Specimen",
 ]
+
+
+def __getattr__(name: str):
+    """
+    Imports resource classes on first use, so that importing fhirflat (or one
+    resource) doesn't build the pydantic models of every resource.
+    """
+    if name in __all__:
+        module = importlib.import_module(f".{name.lower()}", __name__)
+        resource = getattr(module, name)
+        globals()[name] = resource
+        return resource
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import re
 import warnings
 from typing import ClassVar, TypeAlias
 
@@ -13,9 +15,13 @@ from pydantic.v1 import ValidationError
 
 from fhirflat.fhir2flat import fhir2flat
 from fhirflat.flat2fhir import expand_concepts
+from fhirflat.util import group_keys
 
 JsonString: TypeAlias = str
 
+# columns which may hold dates, matched in a single pass over the column name
+DATE_COLUMN = re.compile("date|period|time", re.IGNORECASE)
+
 
 class FHIRFlatBase(_DomainResource):
     """
@@ -36,18 +42,23 @@ class FHIRFlatBase(_DomainResource):
     backbone_elements: ClassVar[dict] = {}
 
     @classmethod
-    def attr_lists(cls) -> list[str]:
-        """Attributes which take a list of FHIR types."""
-        return [
+    @functools.cache
+    def attr_lists(cls) -> tuple[str, ...]:
+        """
+        Attributes which take a list of FHIR types.
+        Computed once per class, as the fields of a resource don't change.
+        """
+        return tuple(
             p.alias
             for p in cls.element_properties()
             if "typing.List" in str(p.outer_type_) or "list" in str(p.outer_type_)
-        ]
+        )
 
     @classmethod
-    def flat_fields(cls) -> list[str]:
+    @functools.cache
+    def flat_fields(cls) -> tuple[str, ...]:
         "All fields that are present in the FHIRflat representation"
-        return [x for x in cls.elements_sequence() if x not in cls.flat_exclusions]
+        return tuple(x for x in cls.elements_sequence() if x not in cls.flat_exclusions)
 
     @classmethod
     def cleanup(cls, data: dict) -> dict:
@@ -77,7 +88,8 @@ class FHIRFlatBase(_DomainResource):
         data = expand_concepts(data, cls)
 
         # create lists for properties which are lists of FHIR types
-        for field in [x for x in data.keys() if x in cls.attr_lists()]:
+        list_attrs = cls.attr_lists()
+        for field in [x for x in data.keys() if x in list_attrs]:
             if not isinstance(data[field], list):
                 data[field] = [data[field]]
 
@@ -103,9 +115,11 @@ class FHIRFlatBase(_DomainResource):
 
         df = pd.read_parquet(file)
 
-        df["fhir"] = df.apply(
-            lambda row: row.to_json(date_format="iso", date_unit="s"), axis=1
-        ).apply(lambda x: cls.create_fhir_resource(x))
+        # serialise the whole frame in one pass rather than once per row
+        records = orjson.loads(
+            df.to_json(orient="records", date_format="iso", date_unit="s")
+        )
+        df["fhir"] = [cls.create_fhir_resource(r) for r in records]
 
         if len(df) == 1:
             resource = df["fhir"].iloc[0]
@@ -154,32 +168,33 @@ class FHIRFlatBase(_DomainResource):
         pd.Series
         """
 
-        def fhir_format(row: pd.Series) -> pd.Series:
-            for b_e, b_c in cls.backbone_elements.items():
-                keys_present = [key for key in row if key.startswith(b_e)]
-                if keys_present:
-                    condensed_dict = {k: row[k] for k in keys_present}
-                    if all(
-                        not isinstance(v, list) or len(v) == 1
-                        for v in condensed_dict.values()
-                    ):
-                        continue
-                    else:
-                        backbone_list = []
-                        # assert all lists are the same length - if not different parts
-                        # of the backbone element may be incorrectly grouped together
-                        assert len(set(map(len, condensed_dict.values()))) == 1
-
-                        # iterate through and split the element into individual levels
-                        for i in range(max(len(x) for x in condensed_dict.values())):
-                            first_item = {
-                                k.lstrip(b_e + "."): v[i]
-                                for k, v in condensed_dict.items()
-                            }
-                            backbone_list.append(expand_concepts(first_item, b_c))
-                        for k_d in condensed_dict:
-                            row.pop(k_d)
-                        row[b_e] = backbone_list
+        def fhir_format(row: dict) -> dict:
+            for b_e, keys_present in group_keys(row.keys()).items():
+                if b_e not in cls.backbone_elements:
+                    continue
+                condensed_dict = {k: row[k] for k in keys_present}
+                if all(
+                    not isinstance(v, list) or len(v) == 1
+                    for v in condensed_dict.values()
+                ):
+                    continue
+
+                # assert all lists are the same length - if not different parts
+                # of the backbone element may be incorrectly grouped together
+                assert len(set(map(len, condensed_dict.values()))) == 1
+
+                # transpose the lists once, splitting the element into individual
+                # levels without indexing into every list for every level
+                sub_keys = [k.removeprefix(b_e + ".") for k in condensed_dict]
+                row[b_e] = [
+                    expand_concepts(
+                        dict(zip(sub_keys, values, strict=True)),
+                        cls.backbone_elements[b_e],
+                    )
+                    for values in zip(*condensed_dict.values(), strict=True)
+                ]
+                for k_d in condensed_dict:
+                    row.pop(k_d)
             return row
 
         condensed_mapped_data = mapped_data.apply(fhir_format)
@@ -215,16 +230,24 @@ class FHIRFlatBase(_DomainResource):
 
         valid_fhir = data[~validation_error_mask].copy()
 
-        # flattens resources back out
-        flat_df = valid_fhir["fhir"].apply(lambda x: x.to_flat())
+        # flattens resources back out, building the frame a column at a time rather
+        # than aligning one series per resource
+        flat_rows = [x.to_flat() for x in valid_fhir["fhir"]]
+        # only allocate a column the first time it is seen - building the default
+        # for every cell would make this quadratic in the number of rows
+        n_rows = len(flat_rows)
+        flat_columns: dict[str, list] = {}
+        for i, row in enumerate(flat_rows):
+            for k, v in row.items():
+                col = flat_columns.get(k)
+                if col is None:
+                    col = flat_columns[k] = [np.nan] * n_rows
+                col[i] = v
+        flat_df = pd.DataFrame(flat_columns, index=valid_fhir.index)
 
         if not flat_df.empty:
             # create FHIR expected date format
-            for date_cols in [
-                x
-                for x in flat_df.columns
-                if ("date" in x.lower() or "period" in x.lower() or "time" in x.lower())
-            ]:
+            for date_cols in [x for x in flat_df.columns if DATE_COLUMN.search(x)]:
                 # replace nan with None
                 flat_df[date_cols] = flat_df[date_cols].replace(np.nan, None)
 
@@ -241,9 +264,7 @@ class FHIRFlatBase(_DomainResource):
                 )
 
             for coding_column in [
-                x
-                for x in flat_df.columns
-                if x.lower().endswith(".code") or x.lower().endswith(".text")
+                x for x in flat_df.columns if x.lower().endswith((".code", ".text"))
             ]:
                 flat_df[coding_column] = flat_df[coding_column].apply(
                     lambda x: [x] if isinstance(x, str) else x
@@ -327,13 +348,12 @@ class FHIRFlatBase(_DomainResource):
             Name of the parquet file to be generated.
         """
 
-        # identify attributes that are lists of FHIR types
-        list_resources = self.attr_lists()
+        # identify attributes that are lists of FHIR types and not excluded
+        list_resources = [x for x in self.attr_lists() if x not in self.flat_exclusions]
 
         # clear data from attributes not used in FHIRflat
         for field in self.flat_exclusions:
             setattr(self, field, None)
-            list_resources.remove(field) if field in list_resources else None
 
         flat_df = fhir2flat(self, lists=list_resources)
 
@@ -8,6 +8,7 @@ from pydantic.v1 import Field, validator
 
 from .base import FHIRFlatBase
 from .extension_types import presenceAbsenceType, prespecifiedQueryType, timingPhaseType
+from .extension_validators import has_duplicate_extensions
 from .extensions import presenceAbsence, prespecifiedQuery, timingPhase
 
 JsonString: TypeAlias = str
@@ -52,11 +53,9 @@ class Condition(_Condition, FHIRFlatBase):
 
     @validator("extension")
     def validate_extension_contents(cls, extensions):
-        present_count = sum(isinstance(item, presenceAbsence) for item in extensions)
-        query_count = sum(isinstance(item, prespecifiedQuery) for item in extensions)
-        timing_count = sum(isinstance(item, timingPhase) for item in extensions)
-
-        if present_count > 1 or query_count > 1 or timing_count > 1:
+        if has_duplicate_extensions(
+            extensions, (presenceAbsence, prespecifiedQuery, timingPhase)
+        ):
             raise ValueError(
                 "presenceAbsence, prespecifiedQuery and timingPhase can only appear"
                 " once."
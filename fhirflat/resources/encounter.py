@@ -15,6 +15,7 @@ from pydantic.v1 import Field, validator
 
 from .base import FHIRFlatBase
 from .extension_types import relativePeriodType, timingPhaseType
+from .extension_validators import has_duplicate_extensions
 from .extensions import relativePeriod, timingPhase
 
 JsonString: TypeAlias = str
@@ -63,10 +64,7 @@ class Encounter(_Encounter, FHIRFlatBase):
 
     @validator("extension")
     def validate_extension_contents(cls, extensions):
-        rel_phase_count = sum(isinstance(item, relativePeriod) for item in extensions)
-        tim_phase_count = sum(isinstance(item, timingPhase) for item in extensions)
-
-        if rel_phase_count > 1 or tim_phase_count > 1:
+        if has_duplicate_extensions(extensions, (relativePeriod, timingPhase)):
             raise ValueError("relativePeriod and timingPhase can only appear once.")
 
         return extensions
@@ -198,6 +198,21 @@ class Validators:
         return v
 
 
+def has_duplicate_extensions(extensions: list, unique_types: tuple[type, ...]) -> bool:
+    """
+    Checks if any of the extension types in unique_types appears more than once in
+    the list of extensions. Stops at the first duplicate found.
+    """
+    seen = set()
+    for ext in extensions:
+        ext_type = type(ext)
+        if ext_type in unique_types:
+            if ext_type in seen:
+                return True
+            seen.add(ext_type)
+    return False
+
+
 def timingphase_validator(v: Union[StrBytes, dict, Path, FHIRAbstractModel]):
     return Validators().fhir_model_validator("timingPhase", v)
 
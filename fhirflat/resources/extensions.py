@@ -17,6 +17,7 @@ from fhir.resources.fhirprimitiveextension import (
 from pydantic.v1 import Field, root_validator, validator
 
 from . import extension_types as et
+from .extension_validators import has_duplicate_extensions
 
 # --------- extensions ------------------------------
 
@@ -202,10 +203,7 @@ class relativePeriod(_DataType):
 
     @validator("extension")
     def validate_extension_contents(cls, extensions):
-        start_count = sum(isinstance(item, relativeStart) for item in extensions)
-        end_count = sum(isinstance(item, relativeEnd) for item in extensions)
-
-        if start_count > 1 or end_count > 1:
+        if has_duplicate_extensions(extensions, (relativeStart, relativeEnd)):
             raise ValueError("relativeStart and relativeEnd can only appear once.")
 
         return extensions
@@ -560,12 +558,7 @@ class dateTimeExtension(_FHIRPrimitiveExtension):
 
     @validator("extension")
     def validate_extension_contents(cls, extensions):
-        approx_date_count = sum(
-            isinstance(item, approximateDate) for item in extensions
-        )
-        rel_day_count = sum(isinstance(item, relativeDay) for item in extensions)
-
-        if approx_date_count > 1 or rel_day_count > 1:
+        if has_duplicate_extensions(extensions, (approximateDate, relativeDay)):
             raise ValueError("approximateDate and relativeDay can only appear once.")
 
         return extensions
@@ -8,6 +8,7 @@ from pydantic.v1 import Field, validator
 
 from .base import FHIRFlatBase
 from .extension_types import dateTimeExtensionType, timingPhaseType
+from .extension_validators import has_duplicate_extensions
 from .extensions import timingPhase
 
 JsonString: TypeAlias = str
@@ -56,9 +57,7 @@ class Immunization(_Immunization, FHIRFlatBase):
 
     @validator("extension")
     def validate_extension_contents(cls, extensions):
-        phase_count = sum(isinstance(item, timingPhase) for item in extensions)
-
-        if phase_count > 1:
+        if has_duplicate_extensions(extensions, (timingPhase,)):
             raise ValueError("timingPhase can only appear once.")
 
         return extensions
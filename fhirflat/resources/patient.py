@@ -8,6 +8,7 @@ from pydantic.v1 import Field, validator
 
 from .base import FHIRFlatBase
 from .extension_types import ageType, birthSexType, raceType
+from .extension_validators import has_duplicate_extensions
 from .extensions import Age, Race, birthSex
 
 JsonString: TypeAlias = str
@@ -45,11 +46,7 @@ class Patient(_Patient, FHIRFlatBase):
 
     @validator("extension")
     def validate_extension_contents(cls, extensions):
-        age_count = sum(isinstance(item, Age) for item in extensions)
-        birthsex_count = sum(isinstance(item, birthSex) for item in extensions)
-        race_count = sum(isinstance(item, Race) for item in extensions)
-
-        if age_count > 1 or birthsex_count > 1 or race_count > 1:
+        if has_duplicate_extensions(extensions, (Age, birthSex, Race)):
             raise ValueError("Age, birthSex and Race can only appear once.")
 
         return extensions
@@ -13,6 +13,7 @@ from .extension_types import (
     relativePeriodType,
     timingPhaseType,
 )
+from .extension_validators import has_duplicate_extensions
 from .extensions import Duration, relativePeriod, timingPhase
 
 JsonString: TypeAlias = str
@@ -65,11 +66,9 @@ class Procedure(_Procedure, FHIRFlatBase):
 
     @validator("extension")
     def validate_extension_contents(cls, extensions):
-        duration_count = sum(isinstance(item, Duration) for item in extensions)
-        tim_phase_count = sum(isinstance(item, timingPhase) for item in extensions)
-        rel_phase_count = sum(isinstance(item, relativePeriod) for item in extensions)
-
-        if duration_count > 1 or tim_phase_count > 1 or rel_phase_count > 1:
+        if has_duplicate_extensions(
+            extensions, (Duration, timingPhase, relativePeriod)
+        ):
             raise ValueError(
                 "duration, timingPhase and relativePeriod can only appear once."
             )
@@ -1,8 +1,9 @@
 # Utility functions for FHIRflat
+import functools
 import importlib
 import re
+from collections import defaultdict
 from collections.abc import KeysView
-from itertools import groupby
 
 import fhir.resources
 
@@ -13,16 +14,18 @@ from fhirflat.resources import extensions
 def group_keys(data_keys: list[str] | KeysView) -> dict[str, list[str]]:
     """
     Finds columns with a '.' in the name denoting data that has been flattened and
-     groups them together.
+     groups them together, in the order they first appear.
 
     ["code.code", "code.text", "value.code", "value.text", "fruitcake"]
     returns
     {"code": ["code.code", "code.text"], "value": ["value.code", "value.text"]}
     """
-    grouped_keys = [k for k in data_keys if "." in k]
-    grouped_keys.sort()
-    groups = {k: list(g) for k, g in groupby(grouped_keys, lambda x: x.split(".")[0])}
-    return groups
+    groups = defaultdict(list)
+    for k in data_keys:
+        group, sep, _ = k.partition(".")
+        if sep:
+            groups[group].append(k)
+    return dict(groups)
 
 
 def get_fhirtype(t: str | list[str]):
@@ -33,6 +36,12 @@ def get_fhirtype(t: str | list[str]):
     if isinstance(t, list):
         return [get_fhirtype(x) for x in t]
 
+    return _get_fhirtype(t)
+
+
+@functools.cache
+def _get_fhirtype(t: str):
+    # the same handful of type names are looked up for every row, so cache the result
     if not (hasattr(extensions, t) or hasattr(extensions, t.capitalize())):
         try:
             return getattr(getattr(fhir.resources, t.lower()), t)
@@ -54,6 +63,7 @@ def get_fhirtype(t: str | list[str]):
         return get_local_extension_type(t)
 
 
+@functools.cache
 def get_local_extension_type(t: str):
     """
     Finds the relevant class from local extensions for a given string.
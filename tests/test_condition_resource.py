@@ -1,114 +1,126 @@
-import pandas as pd
-from pandas.testing import assert_frame_equal
+import pyarrow as pa
+import pyarrow.parquet as pq
 import os
 import datetime
+from types import MappingProxyType
 from fhirflat.resources.condition import Condition
 import pytest
 from pydantic.v1 import ValidationError
 
-CONDITION_DICT_INPUT = {
-    "id": "c201",
-    "extension": [
-        {
-            "url": "presenceAbsence",
-            "valueCodeableConcept": {
+# read-only at the top level only - the nested lists and dicts are still shared
+# between tests, so must not be modified
+CONDITION_DICT_INPUT = MappingProxyType(
+    {
+        "id": "c201",
+        "extension": [
+            {
+                "url": "presenceAbsence",
+                "valueCodeableConcept": {
+                    "coding": [
+                        {
+                            "system": "http://snomed.info/sct",
+                            "code": "410605003",
+                            "display": "Present",
+                        }
+                    ]
+                },
+            },
+            {"url": "prespecifiedQuery", "valueBoolean": True},
+        ],
+        "identifier": [{"value": "12345"}],
+        "clinicalStatus": {
+            "coding": [
+                {
+                    "system": "http://terminology.hl7.org/CodeSystem/condition-clinical",  # noqa: E501
+                    "code": "resolved",
+                }
+            ]
+        },
+        "verificationStatus": {
+            "coding": [
+                {
+                    "system": "http://terminology.hl7.org/CodeSystem/condition-ver-status",  # noqa: E501
+                    "code": "confirmed",
+                }
+            ]
+        },
+        "category": [
+            {
                 "coding": [
                     {
                         "system": "http://snomed.info/sct",
-                        "code": "410605003",
-                        "display": "Present",
-                    }
+                        "code": "55607006",
+                        "display": "Problem",
+                    },
+                    {
+                        "system": (
+                            "http://terminology.hl7.org/CodeSystem/condition-category"
+                        ),
+                        "code": "problem-list-item",
+                    },
                 ]
-            },
-        },
-        {"url": "prespecifiedQuery", "valueBoolean": True},
-    ],
-    "identifier": [{"value": "12345"}],
-    "clinicalStatus": {
-        "coding": [
-            {
-                "system": "http://terminology.hl7.org/CodeSystem/condition-clinical",
-                "code": "resolved",
             }
-        ]
-    },
-    "verificationStatus": {
-        "coding": [
-            {
-                "system": "http://terminology.hl7.org/CodeSystem/condition-ver-status",
-                "code": "confirmed",
-            }
-        ]
-    },
-    "category": [
-        {
+        ],
+        "severity": {
             "coding": [
                 {
                     "system": "http://snomed.info/sct",
-                    "code": "55607006",
-                    "display": "Problem",
-                },
-                {
-                    "system": (
-                        "http://terminology.hl7.org/CodeSystem/condition-category"
-                    ),
-                    "code": "problem-list-item",
-                },
+                    "code": "255604002",
+                    "display": "Mild",
+                }
             ]
-        }
-    ],
-    "severity": {
-        "coding": [
-            {"system": "http://snomed.info/sct", "code": "255604002", "display": "Mild"}
-        ]
-    },
-    "code": {
-        "coding": [
-            {
-                "system": "http://snomed.info/sct",
-                "code": "386661006",
-                "display": "Fever",
-            }
-        ],
-        "text": "Fever",
-    },
-    "bodySite": [
-        {
+        },
+        "code": {
             "coding": [
                 {
                     "system": "http://snomed.info/sct",
-                    "code": "38266002",
-                    "display": "Entire body as a whole",
+                    "code": "386661006",
+                    "display": "Fever",
                 }
             ],
-            "text": "whole body",
-        }
-    ],
-    "subject": {"reference": "Patient/f201", "display": "Roel"},
-    "encounter": {"reference": "Encounter/f201"},
-    "onsetDateTime": "2013-04-02",
-    "abatementString": "around April 9, 2013",
-    "recordedDate": "2013-04-04",
-    "evidence": [
-        {
-            "concept": {
+            "text": "Fever",
+        },
+        "bodySite": [
+            {
                 "coding": [
                     {
                         "system": "http://snomed.info/sct",
-                        "code": "258710007",
-                        "display": "degrees C",
+                        "code": "38266002",
+                        "display": "Entire body as a whole",
                     }
-                ]
-            },
-            "reference": {"reference": "Observation/f202", "display": "Temperature"},
-        }
-    ],
-}
+                ],
+                "text": "whole body",
+            }
+        ],
+        "subject": {"reference": "Patient/f201", "display": "Roel"},
+        "encounter": {"reference": "Encounter/f201"},
+        "onsetDateTime": "2013-04-02",
+        "abatementString": "around April 9, 2013",
+        "recordedDate": "2013-04-04",
+        "evidence": [
+            {
+                "concept": {
+                    "coding": [
+                        {
+                            "system": "http://snomed.info/sct",
+                            "code": "258710007",
+                            "display": "degrees C",
+                        }
+                    ]
+                },
+                "reference": {
+                    "reference": "Observation/f202",
+                    "display": "Temperature",
+                },
+            }
+        ],
+    }
+)
 
 CONDITION_FLAT = {
     "resourceType": ["Condition"],
-    "extension.presenceAbsence.code": ["http://snomed.info/sct|410605003"],
-    "extension.presenceAbsence.text": ["Present"],
+    "extension.presenceAbsence.code": [["http://snomed.info/sct|410605003"]],
+    "extension.presenceAbsence.text": [["Present"]],
     "extension.prespecifiedQuery": [True],
     "category.code": [
         [
@@ -117,91 +129,119 @@ CONDITION_FLAT = {
         ]
     ],
     "category.text": [["Problem", None]],
-    "bodySite.code": ["http://snomed.info/sct|38266002"],
+    "bodySite.code": [["http://snomed.info/sct|38266002"]],
     "bodySite.text": ["whole body"],
     "onsetDateTime": [datetime.date(2013, 4, 2)],
     "abatementString": ["around April 9, 2013"],
     "recordedDate": [datetime.date(2013, 4, 4)],
-    "severity.code": ["http://snomed.info/sct|255604002"],
-    "severity.text": ["Mild"],
-    "code.code": ["http://snomed.info/sct|386661006"],
+    "severity.code": [["http://snomed.info/sct|255604002"]],
+    "severity.text": [["Mild"]],
+    "code.code": [["http://snomed.info/sct|386661006"]],
     "code.text": ["Fever"],
     "subject": ["Patient/f201"],
     "encounter": ["Encounter/f201"],
 }
 
-CONDITION_DICT_OUT = {
-    "extension": [
-        {"url": "prespecifiedQuery", "valueBoolean": True},
-        {
-            "url": "presenceAbsence",
-            "valueCodeableConcept": {
+CONDITION_SCHEMA = pa.schema(
+    [
+        ("resourceType", pa.string()),
+        ("extension.presenceAbsence.code", pa.list_(pa.string())),
+        ("extension.presenceAbsence.text", pa.list_(pa.string())),
+        ("extension.prespecifiedQuery", pa.bool_()),
+        ("category.code", pa.list_(pa.string())),
+        ("category.text", pa.list_(pa.string())),
+        ("bodySite.code", pa.list_(pa.string())),
+        ("bodySite.text", pa.string()),
+        ("onsetDateTime", pa.date32()),
+        ("abatementString", pa.string()),
+        ("recordedDate", pa.date32()),
+        ("severity.code", pa.list_(pa.string())),
+        ("severity.text", pa.list_(pa.string())),
+        ("code.code", pa.list_(pa.string())),
+        ("code.text", pa.string()),
+        ("subject", pa.string()),
+        ("encounter", pa.string()),
+    ]
+)
+
+CONDITION_DICT_OUT = MappingProxyType(
+    {
+        "extension": [
+            {"url": "prespecifiedQuery", "valueBoolean": True},
+            {
+                "url": "presenceAbsence",
+                "valueCodeableConcept": {
+                    "coding": [
+                        {
+                            "system": "http://snomed.info/sct",
+                            "code": "410605003",
+                            "display": "Present",
+                        }
+                    ]
+                },
+            },
+        ],
+        "clinicalStatus": {
+            "coding": [
+                {
+                    "system": "http://terminology.hl7.org/CodeSystem/condition-clinical",  # noqa: E501
+                    "code": "unknown",
+                }
+            ]
+        },
+        "category": [
+            {
                 "coding": [
                     {
                         "system": "http://snomed.info/sct",
-                        "code": "410605003",
-                        "display": "Present",
-                    }
+                        "code": "55607006",
+                        "display": "Problem",
+                    },
+                    {
+                        "system": (
+                            "http://terminology.hl7.org/CodeSystem/condition-category"
+                        ),
+                        "code": "problem-list-item",
+                    },
                 ]
-            },
-        },
-    ],
-    "clinicalStatus": {
-        "coding": [
-            {
-                "system": "http://terminology.hl7.org/CodeSystem/condition-clinical",
-                "code": "unknown",
             }
-        ]
-    },
-    "category": [
-        {
+        ],
+        "severity": {
             "coding": [
                 {
                     "system": "http://snomed.info/sct",
-                    "code": "55607006",
-                    "display": "Problem",
-                },
-                {
-                    "system": (
-                        "http://terminology.hl7.org/CodeSystem/condition-category"
-                    ),
-                    "code": "problem-list-item",
-                },
+                    "code": "255604002",
+                    "display": "Mild",
+                }
             ]
-        }
-    ],
-    "severity": {
-        "coding": [
-            {"system": "http://snomed.info/sct", "code": "255604002", "display": "Mild"}
-        ]
-    },
-    "code": {
-        "coding": [
-            {
-                "system": "http://snomed.info/sct",
-                "code": "386661006",
-                "display": "Fever",
-            }
-        ],
-    },
-    "bodySite": [
-        {
+        },
+        "code": {
             "coding": [
                 {
                     "system": "http://snomed.info/sct",
-                    "code": "38266002",
-                    "display": "whole body",
+                    "code": "386661006",
+                    "display": "Fever",
                 }
             ],
-        }
-    ],
-    "subject": {"reference": "Patient/f201"},
-    "encounter": {"reference": "Encounter/f201"},
-    "onsetDateTime": "2013-04-02T00:00:00",
-    "abatementString": "around April 9, 2013",
-    "recordedDate": "2013-04-04T00:00:00",
-}
+        },
+        "bodySite": [
+            {
+                "coding": [
+                    {
+                        "system": "http://snomed.info/sct",
+                        "code": "38266002",
+                        "display": "whole body",
+                    }
+                ],
+            }
+        ],
+        "subject": {"reference": "Patient/f201"},
+        "encounter": {"reference": "Encounter/f201"},
+        "onsetDateTime": "2013-04-02T00:00:00",
+        "abatementString": "around April 9, 2013",
+        "recordedDate": "2013-04-04T00:00:00",
+    }
+)
 
 
 def test_condition_to_flat():
@@ -209,11 +249,17 @@ def test_condition_to_flat():
 
     fever.to_flat("test_condition.parquet")
 
-    assert_frame_equal(
-        pd.read_parquet("test_condition.parquet"),
-        pd.DataFrame(CONDITION_FLAT),
-        check_like=True,
+    # the pandas index is stored alongside the data and isn't part of FHIRflat
+    actual_table = pq.read_table("test_condition.parquet").drop_columns(
+        "__index_level_0__"
     )
+    expected_table = pa.Table.from_pydict(CONDITION_FLAT, schema=CONDITION_SCHEMA)
+
+    # compare column order-independently, but with strict types
+    assert sorted(actual_table.column_names) == sorted(expected_table.column_names)
+    actual_table = actual_table.select(expected_table.column_names)
+    assert actual_table.schema.equals(expected_table.schema)
+    assert actual_table.equals(expected_table)
     os.remove("test_condition.parquet")
 
 
@@ -225,50 +271,6 @@ def test_condition_from_flat():
     assert fever == flat_fever
 
 
-def test_condition_extension_validation_error():
-    with pytest.raises(ValueError, match="can only appear once"):
-        Condition(
-            **{
-                "id": "c201",
-                "extension": [
-                    {
-                        "url": "presenceAbsence",
-                        "valueCodeableConcept": {
-                            "coding": [
-                                {
-                                    "system": "http://snomed.info/sct",
-                                    "code": "410605003",
-                                    "display": "Present",
-                                }
-                            ]
-                        },
-                    },
-                    {
-                        "url": "presenceAbsence",
-                        "valueCodeableConcept": {
-                            "coding": [
-                                {
-                                    "system": "http://snomed.info/sct",
-                                    "code": "410605003",
-                                    "display": "Present",
-                                }
-                            ]
-                        },
-                    },
-                ],
-                "subject": {"reference": "Patient/f201"},
-                "clinicalStatus": {
-                    "coding": [
-                        {
-                            "system": "http://terminology.hl7.org/CodeSystem/condition-clinical",  # noqa: E501
-                            "code": "resolved",
-                        }
-                    ]
-                },
-            }
-        )
-
-
 def test_from_flat_validation_error_single():
     with pytest.raises(ValidationError, match="1 validation error for Condition"):
         Condition.from_flat("tests/data/condition_flat_missing_subject.parquet")
@@ -379,41 +379,6 @@ def test_encounter_from_flat():
     assert visit == flat_visit
 
 
-def test_encounter_extension_validation_error():
-    with pytest.raises(ValueError, match="can only appear once"):
-        Encounter(
-            **{
-                "status": "active",
-                "extension": [
-                    {
-                        "url": "timingPhase",
-                        "valueCodeableConcept": {
-                            "coding": [
-                                {
-                                    "system": "http://snomed.info/sct",
-                                    "code": 278307001,
-                                    "display": "on admission",
-                                }
-                            ]
-                        },
-                    },
-                    {
-                        "url": "timingPhase",
-                        "valueCodeableConcept": {
-                            "coding": [
-                                {
-                                    "system": "http://snomed.info/sct",
-                                    "code": 278307001,
-                                    "display": "on admission",
-                                }
-                            ]
-                        },
-                    },
-                ],
-            }
-        )
-
-
 def test_from_flat_validation_error_multi_resources():
     with pytest.warns(UserWarning, match="Validation errors found in the data."):
         fhir_resources = Encounter.from_flat(
@@ -0,0 +1,130 @@
+import re
+import pytest
+from fhirflat.resources.condition import Condition
+from fhirflat.resources.encounter import Encounter
+from fhirflat.resources.immunization import Immunization
+from fhirflat.resources.patient import Patient
+from fhirflat.resources.procedure import Procedure
+
+SNOMED = "http://snomed.info/sct"
+
+PRESENT = {
+    "url": "presenceAbsence",
+    "valueCodeableConcept": {
+        "coding": [
+            {
+                "system": SNOMED,
+                "code": "410605003",
+                "display": "Present",
+            }
+        ]
+    },
+}
+
+ON_ADMISSION = {
+    "url": "timingPhase",
+    "valueCodeableConcept": {
+        "coding": [
+            {
+                "system": SNOMED,
+                "code": 278307001,
+                "display": "on admission",
+            }
+        ]
+    },
+}
+
+DURING_ADMISSION = {
+    "url": "timingPhase",
+    "valueCodeableConcept": {
+        "coding": [
+            {
+                "system": SNOMED,
+                "code": 278307005,
+                "display": "during admission",
+            }
+        ]
+    },
+}
+
+
+@pytest.mark.parametrize(
+    "cls, fhir_input, message",
+    [
+        (
+            Condition,
+            {
+                "id": "c201",
+                "extension": [PRESENT, PRESENT],
+                "subject": {"reference": "Patient/f201"},
+                "clinicalStatus": {
+                    "coding": [
+                        {
+                            "system": "http://terminology.hl7.org/CodeSystem/condition-clinical",  # noqa: E501
+                            "code": "resolved",
+                        }
+                    ]
+                },
+            },
+            "presenceAbsence, prespecifiedQuery and timingPhase can only appear once.",
+        ),
+        (
+            Encounter,
+            {
+                "status": "active",
+                "extension": [ON_ADMISSION, ON_ADMISSION],
+            },
+            "relativePeriod and timingPhase can only appear once.",
+        ),
+        (
+            Immunization,
+            {
+                "id": 2,
+                "status": "in-progress",
+                "extension": [ON_ADMISSION, DURING_ADMISSION],
+                "patient": {"reference": "Patient/example"},
+                "occurrenceDateTime": "2021-09-12T00:00:00",
+                "vaccineCode": {
+                    "coding": [
+                        {
+                            "system": "http://hl7.org/fhir/sid/cvx",
+                            "code": "175",
+                            "display": "Rabies - IM Diploid cell culture",
+                        }
+                    ],
+                },
+            },
+            "timingPhase can only appear once.",
+        ),
+        (
+            Patient,
+            {
+                "id": "f001",
+                "active": True,
+                "extension": [
+                    {"url": "age", "valueQuantity": {"value": 25, "unit": "years"}},
+                    {"url": "age", "valueQuantity": {"value": 30, "unit": "years"}},
+                ],
+                "name": [{"text": "Minnie Mouse"}],
+            },
+            "Age, birthSex and Race can only appear once.",
+        ),
+        (
+            Procedure,
+            {
+                "id": 1,
+                "status": "completed",
+                "subject": {"reference": "Patient/example"},
+                "extension": [
+                    {"url": "duration", "valueQuantity": {"value": 1, "unit": "d"}},
+                    {"url": "duration", "valueQuantity": {"value": 2, "unit": "d"}},
+                ],
+            },
+            "duration, timingPhase and relativePeriod can only appear once.",
+        ),
+    ],
+    ids=["Condition", "Encounter", "Immunization", "Patient", "Procedure"],
+)
+def test_extension_validation_error(cls, fhir_input, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        cls(**fhir_input)
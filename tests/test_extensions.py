@@ -1,5 +1,6 @@
 import pytest
 import datetime
+from types import MappingProxyType
 from fhir.resources.extension import Extension
 from fhir.resources.datatype import DataType
 from fhir.resources.fhirprimitiveextension import FHIRPrimitiveExtension
@@ -15,76 +16,102 @@ from fhirflat.resources.extensions import (
     Duration,
     dateTimeExtension,
 )
+from fhirflat.resources.extension_validators import has_duplicate_extensions
 from pydantic.v1.error_wrappers import ValidationError
 
-timing_phase_data = {
-    "url": "timingPhase",
-    "valueCodeableConcept": {
-        "coding": [
-            {
-                "system": "http://snomed.info/sct",
-                "code": "307168008",
-                "display": "During admission (qualifier value)",
-            }
-        ]
-    },
-}
+# allowed types for the sub-extensions of the nested extensions
+_REL_PHASE_TYPES = (relativeStart, relativeEnd)
+_DTE_TYPES = (approximateDate, relativeDay, Extension)
+
+
+def _build(cls, data):
+    """
+    Creates an extension from trusted test data without running validation.
+    Only for tests that check wiring (resource_type, url) rather than parsing.
+    """
+    return cls.construct(**data)
+
+
+# shared payloads used by the fixtures and tests below, read-only at the top level
+# only - nested values must not be modified
+timing_phase_data = MappingProxyType(
+    {
+        "url": "timingPhase",
+        "valueCodeableConcept": {
+            "coding": [
+                {
+                    "system": "http://snomed.info/sct",
+                    "code": "307168008",
+                    "display": "During admission (qualifier value)",
+                }
+            ]
+        },
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def timing_phase():
+    return timingPhase(**timing_phase_data)
 
 
-def test_timingPhase():
-    timing_phase = timingPhase(**timing_phase_data)
+def test_timingPhase(timing_phase):
     assert isinstance(timing_phase, DataType)
     assert timing_phase.resource_type == "timingPhase"
     assert timing_phase.url == "timingPhase"
     assert type(timing_phase.valueCodeableConcept) is _CodeableConcept
 
 
-rel_day = {"url": "relativeDay", "valueInteger": 3}
+rel_day = MappingProxyType({"url": "relativeDay", "valueInteger": 3})
 
 
 def test_relativeDay():
-    relative_day = relativeDay(**rel_day)
+    relative_day = _build(relativeDay, rel_day)
     assert isinstance(relative_day, DataType)
     assert relative_day.resource_type == "relativeDay"
     assert relative_day.url == "relativeDay"
     assert type(relative_day.valueInteger) is int
 
 
-start_date = {"url": "relativeStart", "valueInteger": 3}
+start_date = MappingProxyType({"url": "relativeStart", "valueInteger": 3})
 
 
 def test_relativeStart():
-    relative_start = relativeStart(**start_date)
+    relative_start = _build(relativeStart, start_date)
     assert isinstance(relative_start, DataType)
     assert relative_start.resource_type == "relativeStart"
     assert relative_start.url == "relativeStart"
     assert type(relative_start.valueInteger) is int
 
 
-end_date = {"url": "relativeEnd", "valueInteger": 5}
+end_date = MappingProxyType({"url": "relativeEnd", "valueInteger": 5})
 
 
 def test_relativeEnd():
-    relative_end = relativeEnd(**end_date)
+    relative_end = _build(relativeEnd, end_date)
     assert isinstance(relative_end, DataType)
     assert relative_end.resource_type == "relativeEnd"
     assert relative_end.url == "relativeEnd"
     assert type(relative_end.valueInteger) is int
 
 
-relative_phase_data = {"url": "relativePeriod", "extension": [start_date, end_date]}
+# fhir.resources only accepts dicts for nested elements, so nest plain copies
+relative_phase_data = MappingProxyType(
+    {"url": "relativePeriod", "extension": [dict(start_date), dict(end_date)]}
+)
+
+
+@pytest.fixture(scope="session")
+def relative_phase():
+    return relativePeriod(**relative_phase_data)
 
 
-def test_relativePeriod():
-    relative_phase = relativePeriod(**relative_phase_data)
+def test_relativePeriod(relative_phase):
     assert isinstance(relative_phase, DataType)
     assert relative_phase.resource_type == "relativePeriod"
     assert relative_phase.url == "relativePeriod"
     assert isinstance(relative_phase.extension, list)
-    assert all(
-        isinstance(ext, (relativeStart, relativeEnd))
-        for ext in relative_phase.extension
-    )
+    assert all(isinstance(ext, _REL_PHASE_TYPES) for ext in relative_phase.extension)
 
 
 @pytest.mark.parametrize(
@@ -110,26 +137,38 @@ def test_approximateDate(data, expected_type_date, expected_type_str):
 dur = {"url": "duration", "valueQuantity": {"value": 3, "unit": "days"}}
 
 
-def test_duration():
-    duration_inst = Duration(**dur)
+@pytest.fixture(scope="session")
+def duration_inst():
+    return Duration(**dur)
+
+
+def test_duration(duration_inst):
     assert isinstance(duration_inst, DataType)
     assert duration_inst.resource_type == "Duration"
     assert duration_inst.url == "duration"
     assert type(duration_inst.valueQuantity) is _Quantity
 
 
-dte = {"extension": [{"url": "approximateDate", "valueDate": "2021-01-01"}, rel_day]}
+dte = MappingProxyType(
+    {
+        "extension": [
+            {"url": "approximateDate", "valueDate": "2021-01-01"},
+            dict(rel_day),
+        ]
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def date_time_extension():
+    return dateTimeExtension(**dte)
 
 
-def test_dateTimeExtension():
-    date_time_extension = dateTimeExtension(**dte)
+def test_dateTimeExtension(date_time_extension):
     assert isinstance(date_time_extension, FHIRPrimitiveExtension)
     assert date_time_extension.resource_type == "dateTimeExtension"
     assert isinstance(date_time_extension.extension, list)
-    assert all(
-        isinstance(ext, (approximateDate, relativeDay, Extension))
-        for ext in date_time_extension.extension
-    )
+    assert all(isinstance(ext, _DTE_TYPES) for ext in date_time_extension.extension)
 
 
 @pytest.mark.parametrize(
@@ -167,4 +206,30 @@ def test_extension_name_error(ext_class, data):
 )
 def test_extension_validation_error(ext_class, data):
     with pytest.raises(ValidationError):
-        ext_class(**data)(**data)
+        ext_class(**data)
+
+
+@pytest.fixture(scope="session")
+def relative_day():
+    return relativeDay(**rel_day)
+
+
+@pytest.fixture(scope="session")
+def approximate_date():
+    return approximateDate(url="approximateDate", valueDate="2021-01-01")
+
+
+@pytest.mark.parametrize(
+    "extension_fixtures, expected",
+    [
+        (["relative_day", "approximate_date"], False),
+        (["relative_day", "relative_day"], True),
+        (["timing_phase", "timing_phase"], False),
+    ],
+)
+def test_has_duplicate_extensions(request, extension_fixtures, expected):
+    # reuse the session-wide instances rather than validating new ones
+    extensions = [request.getfixturevalue(f) for f in extension_fixtures]
+    assert (
+        has_duplicate_extensions(extensions, (relativeDay, approximateDate)) is expected
+    )
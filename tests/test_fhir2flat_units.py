@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import fhirflat.fhir2flat as f2f
 import pytest
@@ -153,3 +154,32 @@ def test_condenseReference(data, expected):
     # Check the result
     expected = pd.DataFrame(expected)
     pd.testing.assert_frame_equal(result, expected)
+
+
+def test_condenseSystem():
+    # one frame covering several rows, as condenseSystem works on whole columns
+    df = pd.DataFrame(
+        {
+            "test.system": [
+                "http://loinc.org",
+                "http://snomed.info/sct",
+                "http://loinc.org",
+            ],
+            "test.code": ["1234", "5678", None],
+            "test.display": ["Test", "Test2", "Test3"],
+        }
+    )
+
+    result = f2f.condenseSystem(df, "test.system")
+
+    expected = pd.DataFrame(
+        {
+            "test.code": [
+                "http://loinc.org|1234",
+                "http://snomed.info/sct|5678",
+                np.nan,
+            ],
+            "test.display": ["Test", "Test2", "Test3"],
+        }
+    )
+    pd.testing.assert_frame_equal(result, expected)
@@ -2,19 +2,23 @@ import fhirflat.flat2fhir as f2f
 import pytest
 from fhir.resources.encounter import Encounter
 
+LOINC = "http://loinc.org"
+SNOMED = "http://snomed.info/sct"
+UCUM = "http://unitsofmeasure.org"
+
 
 @pytest.mark.parametrize(
     "data_groups, expected",
     [
         (
             (
-                {"code.code": ["http://loinc.org|1234"], "code.text": ["Test"]},
+                {"code.code": [f"{LOINC}|1234"], "code.text": ["Test"]},
                 "code",
             ),
             {
                 "coding": [
                     {
-                        "system": "http://loinc.org",
+                        "system": LOINC,
                         "code": "1234",
                         "display": "Test",
                     }
@@ -25,8 +29,8 @@ from fhir.resources.encounter import Encounter
             (
                 {
                     "code.code": [
-                        "http://loinc.org|1234",
-                        "http://snomed.info/sct|5678",
+                        f"{LOINC}|1234",
+                        f"{SNOMED}|5678",
                     ],
                     "code.text": ["Test", "Snomed Test"],
                 },
@@ -35,12 +39,12 @@ from fhir.resources.encounter import Encounter
             {
                 "coding": [
                     {
-                        "system": "http://loinc.org",
+                        "system": LOINC,
                         "code": "1234",
                         "display": "Test",
                     },
                     {
-                        "system": "http://snomed.info/sct",
+                        "system": SNOMED,
                         "code": "5678",
                         "display": "Snomed Test",
                     },
@@ -85,7 +89,7 @@ def test_create_codeable_concept(data_groups, expected):
             (
                 {
                     "code.code": ["1234"],
-                    "code.system": ["http://loinc.org"],
+                    "code.system": [LOINC],
                     "code.text": ["Test"],
                 },
                 "code",
@@ -93,7 +97,7 @@ def test_create_codeable_concept(data_groups, expected):
             {
                 "coding": [
                     {
-                        "system": "http://loinc.org",
+                        "system": LOINC,
                         "code": "1234",
                         "display": "Test",
                     }
@@ -104,7 +108,7 @@ def test_create_codeable_concept(data_groups, expected):
             (
                 {
                     "code.code": ["1234", "5678"],
-                    "code.system": ["http://loinc.org", "http://snomed.info/sct"],
+                    "code.system": [LOINC, SNOMED],
                     "code.text": ["Test", "Snomed Test"],
                 },
                 "code",
@@ -112,12 +116,12 @@ def test_create_codeable_concept(data_groups, expected):
             {
                 "coding": [
                     {
-                        "system": "http://loinc.org",
+                        "system": LOINC,
                         "code": "1234",
                         "display": "Test",
                     },
                     {
-                        "system": "http://snomed.info/sct",
+                        "system": SNOMED,
                         "code": "5678",
                         "display": "Snomed Test",
                     },
@@ -139,7 +143,7 @@ def test_create_codeable_concept_ingestion(data_groups, expected):
         (
             (
                 {
-                    "admission.admitSource.code": ["http://snomed.info/sct|309902002"],
+                    "admission.admitSource.code": [f"{SNOMED}|309902002"],
                     "admission.admitSource.text": ["Clinical Oncology Department"],
                     "admission.destination": {"reference": "Location/2"},
                     "admission.origin": {"reference": "Location/2"},
@@ -151,7 +155,7 @@ def test_create_codeable_concept_ingestion(data_groups, expected):
                     "admitSource": {
                         "coding": [
                             {
-                                "system": "http://snomed.info/sct",
+                                "system": SNOMED,
                                 "code": "309902002",
                                 "display": "Clinical Oncology Department",
                             }
@@ -169,3 +173,55 @@ def test_expand_concepts(data_class, expected):
     result = f2f.expand_concepts(data, data_class)
 
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (
+            {
+                "valueQuantity.value": 36.2,
+                "valueQuantity.unit": "DegreesCelsius",
+                "valueQuantity.code": f"{UCUM}|Cel",
+            },
+            {
+                "value": 36.2,
+                "unit": "DegreesCelsius",
+                "code": "Cel",
+                "system": UCUM,
+            },
+        ),
+        (
+            {
+                "valueQuantity.value": 36.2,
+                "valueQuantity.code": "Cel",
+                "valueQuantity.system": UCUM,
+            },
+            {"value": 36.2, "code": "Cel", "system": UCUM},
+        ),
+    ],
+)
+def test_create_quantity(data, expected):
+    assert f2f.createQuantity(data, "valueQuantity") == expected
+
+
+@pytest.mark.parametrize(
+    "code, expected",
+    [
+        (f"{LOINC}|1234", (LOINC, "1234")),
+        ("https://snomed.info/sct|", ("https://snomed.info/sct", "")),
+    ],
+)
+def test_split_code(code, expected):
+    assert f2f.split_code(code) == expected
+
+
+def test_split_code_error():
+    with pytest.raises(ValueError, match="is not in the form"):
+        f2f.split_code("1234")
+
+
+def test_schema_properties():
+    props = f2f.schema_properties(Encounter)
+    assert props is f2f.schema_properties(Encounter)
+    assert props["admission"]["type"] == "EncounterAdmission"
@@ -259,6 +259,25 @@ ENCOUNTER_DICT_OUT = {
 }
 
 
+def test_create_dict_from_dataframe():
+    data = pd.read_csv("tests/dummy_data/encounter_dummy_data_single.csv")
+    original = data.copy()
+
+    df = create_dictionary(
+        data,
+        "tests/dummy_data/encounter_dummy_mapping.csv",
+        "Encounter",
+        one_to_one=True,
+        date_format="%Y-%m-%d",
+        timezone="Brazil/East",
+    )
+
+    assert df is not None
+    assert df["flat_dict"][0] == ENCOUNTER_DICT_OUT
+    # the data is shared between resources, so must be left untouched
+    assert_frame_equal(data, original)
+
+
 def test_create_dict_one_to_one_single_row():
     df = create_dictionary(
         "tests/dummy_data/encounter_dummy_data_single.csv",
@@ -517,7 +536,7 @@ ENCOUNTER_SINGLE_ROW_FLAT = {
 }
 
 
-def test_load_data_one_to_one_single_row():
+def test_load_data_one_to_one_single_row(tmp_path):
     df = create_dictionary(
         "tests/dummy_data/encounter_dummy_data_single.csv",
         "tests/dummy_data/encounter_dummy_mapping.csv",
@@ -528,17 +547,60 @@ def test_load_data_one_to_one_single_row():
     )
 
     assert df is not None
-    Encounter.ingest_to_flat(df, "encounter_ingestion_single")
+    Encounter.ingest_to_flat(df, tmp_path / "encounter_ingestion_single")
 
     assert_frame_equal(
-        pd.read_parquet("encounter_ingestion_single.parquet"),
+        pd.read_parquet(tmp_path / "encounter_ingestion_single.parquet"),
         pd.DataFrame([ENCOUNTER_SINGLE_ROW_FLAT], index=[0]),
         check_dtype=False,
     )
-    os.remove("encounter_ingestion_single.parquet")
 
 
-def test_load_data_one_to_one_dense_single_row():
+def test_ingest_backbone_elements_multi_level():
+    # sub-keys like 'location.location' begin with characters of the prefix, and
+    # must only have the prefix itself removed
+    location_type = "http://terminology.hl7.org/CodeSystem/location-physical-type"
+    mapped_data = pd.Series(
+        [
+            {
+                "subject": "Patient/1",
+                "location.location": ["Location/1", "Location/2"],
+                "location.status": ["completed", "active"],
+                "location.form.system": [location_type, location_type],
+                "location.form.code": ["wa", "ro"],
+                "location.form.text": ["Ward", "Room"],
+            }
+        ]
+    )
+
+    result = Encounter.ingest_backbone_elements(mapped_data)
+
+    assert result[0] == {
+        "subject": "Patient/1",
+        "location": [
+            {
+                "location": "Location/1",
+                "status": "completed",
+                "form": {
+                    "coding": [
+                        {"system": location_type, "code": "wa", "display": "Ward"}
+                    ]
+                },
+            },
+            {
+                "location": "Location/2",
+                "status": "active",
+                "form": {
+                    "coding": [
+                        {"system": location_type, "code": "ro", "display": "Room"}
+                    ]
+                },
+            },
+        ],
+    }
+
+
+def test_load_data_one_to_one_dense_single_row(tmp_path):
     df = create_dictionary(
         "tests/dummy_data/data_multirow_encounter_freetext_maindiag.csv",
         "tests/dummy_data/encounter_dummy_mapping.csv",
@@ -549,9 +611,9 @@ def test_load_data_one_to_one_dense_single_row():
     )
 
     assert df is not None
-    Encounter.ingest_to_flat(df, "encounter_ingestion_dense")
+    Encounter.ingest_to_flat(df, tmp_path / "encounter_ingestion_dense")
 
-    df_parquet = pd.read_parquet("encounter_ingestion_dense.parquet")
+    df_parquet = pd.read_parquet(tmp_path / "encounter_ingestion_dense.parquet")
 
     expected_diagnosis = [
         {
@@ -598,7 +660,6 @@ def test_load_data_one_to_one_dense_single_row():
     ]
 
     assert all(df_parquet["diagnosis_dense"][0] == expected_diagnosis)
-    os.remove("encounter_ingestion_dense.parquet")
 
 
 ENCOUNTER_SINGLE_ROW_MULTI = {
@@ -786,7 +847,7 @@ ENCOUNTER_SINGLE_ROW_MULTI = {
 }
 
 
-def test_load_data_one_to_one_multi_row():
+def test_load_data_one_to_one_multi_row(tmp_path):
     df = create_dictionary(
         "tests/dummy_data/encounter_dummy_data_multi_patient.csv",
         "tests/dummy_data/encounter_dummy_mapping.csv",
@@ -797,15 +858,14 @@ def test_load_data_one_to_one_multi_row():
     )
 
     assert df is not None
-    Encounter.ingest_to_flat(df, "encounter_ingestion_multi")
+    Encounter.ingest_to_flat(df, tmp_path / "encounter_ingestion_multi")
 
     assert_frame_equal(
-        pd.read_parquet("encounter_ingestion_multi.parquet"),
+        pd.read_parquet(tmp_path / "encounter_ingestion_multi.parquet"),
         pd.DataFrame(ENCOUNTER_SINGLE_ROW_MULTI),
         check_dtype=False,
         check_like=True,
     )
-    os.remove("encounter_ingestion_multi.parquet")
 
 
 OBS_FLAT = {
@@ -880,7 +940,7 @@ OBS_FLAT = {
 }
 
 
-def test_load_data_one_to_many_multi_row():
+def test_load_data_one_to_many_multi_row(tmp_path):
     df = create_dictionary(
         "tests/dummy_data/vital_signs_dummy_data.csv",
         "tests/dummy_data/observation_dummy_mapping.csv",
@@ -892,9 +952,9 @@ def test_load_data_one_to_many_multi_row():
 
     assert df is not None
     clean_df = df.dropna().copy()
-    Observation.ingest_to_flat(clean_df, "observation_ingestion")
+    Observation.ingest_to_flat(clean_df, tmp_path / "observation_ingestion")
 
-    full_df = pd.read_parquet("observation_ingestion.parquet")
+    full_df = pd.read_parquet(tmp_path / "observation_ingestion.parquet")
 
     assert len(full_df) == 33
 
@@ -906,7 +966,6 @@ def test_load_data_one_to_many_multi_row():
         check_dtype=False,
         check_like=True,
     )
-    os.remove("observation_ingestion.parquet")
 
 
 def test_convert_data_to_flat_missing_mapping_error():
@@ -959,8 +1018,8 @@ def test_write_metadata():
     os.remove("tests/bundle/sha256sums.txt")
 
 
-def test_convert_data_to_flat_local_mapping():
-    output_folder = "tests/ingestion_output"
+def test_convert_data_to_flat_local_mapping(tmp_path):
+    output_folder = tmp_path / "ingestion_output"
     mappings = {
         Encounter: "tests/dummy_data/encounter_dummy_mapping.csv",
         Observation: "tests/dummy_data/observation_dummy_mapping.csv",
@@ -975,8 +1034,8 @@ def test_convert_data_to_flat_local_mapping():
         mapping_files_types=(mappings, resource_types),
     )
 
-    encounter_df = pd.read_parquet("tests/ingestion_output/encounter.parquet")
-    obs_df = pd.read_parquet("tests/ingestion_output/observation.parquet")
+    encounter_df = pd.read_parquet(output_folder / "encounter.parquet")
+    obs_df = pd.read_parquet(output_folder / "observation.parquet")
 
     assert_frame_equal(
         encounter_df,
@@ -996,11 +1055,9 @@ def test_convert_data_to_flat_local_mapping():
         check_like=True,
     )
 
-    shutil.rmtree(output_folder)
-
 
-def test_convert_data_to_flat_local_mapping_zipped():
-    output_folder = "tests/ingestion_output"
+def test_convert_data_to_flat_local_mapping_zipped(tmp_path):
+    output_folder = tmp_path / "ingestion_output"
     mappings = {
         Encounter: "tests/dummy_data/encounter_dummy_mapping.csv",
     }
@@ -1015,9 +1072,7 @@ def test_convert_data_to_flat_local_mapping_zipped():
         compress_format="zip",
     )
 
-    assert os.path.exists("tests/ingestion_output.zip")
-
-    os.remove("tests/ingestion_output.zip")
+    assert os.path.exists(tmp_path / "ingestion_output.zip")
 
 
 def test_main(capsys, monkeypatch):
@@ -1041,7 +1096,7 @@ def test_main(capsys, monkeypatch):
     shutil.rmtree("fhirflat_output")
 
 
-def test_ingest_to_flat_validation_errors():
+def test_ingest_to_flat_validation_errors(tmp_path):
     df = pd.DataFrame(
         {
             "subjid": [2],
@@ -1084,7 +1139,7 @@ def test_ingest_to_flat_validation_errors():
         index=[0],
     )
 
-    error_df = Encounter.ingest_to_flat(df, "encounter_date_error")
+    error_df = Encounter.ingest_to_flat(df, tmp_path / "encounter_date_error")
     assert len(error_df) == 1
     assert (
         repr(error_df["validation_error"][0].errors())
@@ -1092,8 +1147,8 @@ def test_ingest_to_flat_validation_errors():
     )
 
 
-def test_convert_data_to_flat_local_mapping_errors():
-    output_folder = "tests/ingestion_output_errors"
+def test_convert_data_to_flat_local_mapping_errors(tmp_path):
+    output_folder = tmp_path / "ingestion_output_errors"
     mappings = {
         Encounter: "tests/dummy_data/encounter_dummy_mapping.csv",
         Observation: "tests/dummy_data/observation_dummy_mapping.csv",
@@ -1109,8 +1164,8 @@ def test_convert_data_to_flat_local_mapping_errors():
             mapping_files_types=(mappings, resource_types),
         )
 
-    encounter_df = pd.read_parquet("tests/ingestion_output_errors/encounter.parquet")
-    obs_df = pd.read_parquet("tests/ingestion_output_errors/observation.parquet")
+    encounter_df = pd.read_parquet(output_folder / "encounter.parquet")
+    obs_df = pd.read_parquet(output_folder / "observation.parquet")
 
     expected_encounter_minus_errors = (
         pd.DataFrame(ENCOUNTER_SINGLE_ROW_MULTI).iloc[:-1].dropna(axis=1, how="all")
@@ -1134,11 +1189,9 @@ def test_convert_data_to_flat_local_mapping_errors():
         check_like=True,
     )
 
-    encounter_error = pd.read_csv("tests/ingestion_output_errors/encounter_errors.csv")
+    encounter_error = pd.read_csv(output_folder / "encounter_errors.csv")
     assert len(encounter_error) == 1
     assert (
         encounter_error["validation_error"][0]
         == "1 validation error for Encounter\nactualPeriod -> start\n  invalid datetime format (type=value_error.datetime)"  # noqa: E501
     )
-
-    shutil.rmtree(output_folder)
@@ -1,5 +1,4 @@
 import pytest
-from pytest_unordered import unordered
 import fhirflat
 from fhirflat.util import (
     group_keys,
@@ -30,15 +29,15 @@ def test_group_keys():
     ]
     result = group_keys(data)
 
+    # groups and their keys keep the order they first appear in
     assert result == {
-        "code": unordered(["code.code", "code.text"]),
-        "class": unordered(["class.code", "class.text"]),
-        "priority": unordered(["priority.code", "priority.text"]),
-        "type": unordered(["type.code", "type.text"]),
-        "participant": unordered(
-            ["participant.type.code", "participant.actor.reference"]
-        ),
+        "code": ["code.code", "code.text"],
+        "class": ["class.code", "class.text"],
+        "priority": ["priority.code", "priority.text"],
+        "type": ["type.code", "type.text"],
+        "participant": ["participant.type.code", "participant.actor.reference"],
     }
+    assert list(result) == ["code", "class", "priority", "type", "participant"]
 
 
 @pytest.mark.parametrize(
@@ -68,6 +67,14 @@ def test_get_fhirtype_raises():
         get_fhirtype("NotARealType")
 
 
+def test_get_local_extension_type_cached():
+    get_local_extension_type("timingPhase")
+    hits = get_local_extension_type.cache_info().hits
+
+    assert get_local_extension_type("timingPhase") is get_fhirtype("timingPhase")
+    assert get_local_extension_type.cache_info().hits > hits
+
+
 def test_get_local_extension_type_raises():
     with pytest.raises(
         AttributeError, match="Could not find NotARealType in fhirflat extensions"
@@ -78,3 +85,7 @@ def test_get_local_extension_type_raises():
 def test_get_local_resource():
     result = get_local_resource("Patient")
     assert result == fhirflat.Patient
+
+
+def test_resources_listed_in_dir():
+    assert {"Encounter", "Patient", "convert_data_to_flat"} <= set(dir(fhirflat))